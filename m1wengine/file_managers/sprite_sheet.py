@@ -56,6 +56,7 @@ class SpriteSheet:
         """
         # Loads image from x, y, x+offset, y+offset.
         rect: pygame.Rect = pygame.Rect(rectangle)
+        # new surfaces already use the display pixel format, so no convert needed
         image: pygame.Surface = pygame.Surface(rect.size)
         if self._sheet:
             image.blit(self._sheet, (0, 0), rect)
@@ -1,6 +1,10 @@
 """This module contains the CameraManager class."""
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Callable
 import pygame
 from m1wengine.tiles.entities.characters.player import Player
+from m1wengine.tiles.tile import Tile
 
 
 class CameraManager(pygame.sprite.Group):
@@ -16,17 +20,48 @@ class CameraManager(pygame.sprite.Group):
         Half the display surface width
     _half_height: int
         Half the display surface height
+    _display_surface: pygame.Surface
+        The surface the camera sprites are drawn onto
+    _view_rect: pygame.Rect
+        The area of the display surface, sprites outside of it are not drawn
     _offset: pygame.math.Vector2
         The offset at which to render all sprites
     _player_character: Player
         The currently shown frame represented by an index
+    _ground: list[pygame.sprite.Sprite]
+        Flat ground sprites, drawn below all other sprites in the order added
+    _ground_sprites: set[pygame.sprite.Sprite]
+        The same sprites as _ground, for fast membership checks
+    _adding_ground: bool
+        Flag whether sprites being added belong to the ground layer
+    _ysorted: list[pygame.sprite.Sprite]
+        All upright sprites in the group, kept ordered by rect.bottom
+    _ysorted_dirty: bool
+        Flag whether _ysorted needs a full sort before the next update
+    _ground_margin: int
+        The largest ground rect or image side, used as the margin when culling
+    _camera_tracker: Tile
+        Invisible tile that accumulates the camera movement shared by all sprites
 
     Methods
     -------
+    add_ground(self, *sprites: pygame.sprite.Sprite)
+        Add flat sprites drawn below all other sprites
+    add_internal(self, sprite: pygame.sprite.Sprite, layer: int = None)
+        Add a sprite to the group and to the ground or y-sorted list
+    remove_internal(self, sprite: pygame.sprite.Sprite)
+        Remove a sprite from the group and from the ground or y-sorted list
+    sort_by_bottom(self)
+        Restore the y-sorted order of the sprites
     camera_update(self)
         Renders all sprites relative to the player character position
+    camera_draw(self)
+        Draws the visible ground, then the visible upright sprites in y-sorted order
     """
 
+    # upright sprites are ordered by where they touch the ground
+    BOTTOM_KEY: attrgetter = attrgetter("rect.bottom")
+
     def __init__(self, player_character: Player) -> None:
         """Construct a CameraManager object.
 
@@ -38,34 +73,193 @@ class CameraManager(pygame.sprite.Group):
         player_character: Player
             The player character that entities move around
         """
+        self._ground: list[pygame.sprite.Sprite] = []
+        self._ground_sprites: set[pygame.sprite.Sprite] = set()
+        self._adding_ground: bool = False
+        self._ysorted: list[pygame.sprite.Sprite] = []
+        self._ysorted_dirty: bool = False
+        self._ground_margin: int = 0
         super().__init__()
         surface_x: int = 0
         surface_y: int = 1
-        display_surface: pygame.Surface = pygame.display.get_surface()
+        self._display_surface: pygame.Surface = pygame.display.get_surface()
+        self._view_rect: pygame.Rect = self._display_surface.get_rect()
         self._half_width: int = (
-            display_surface.get_size()[surface_x] // 2
+            self._display_surface.get_size()[surface_x] // 2
         )  # floor division, returns int
         self._half_height: int = (
-            display_surface.get_size()[surface_y] // 2
+            self._display_surface.get_size()[surface_y] // 2
         )  # floor division, returns int
 
         self._offset: pygame.math.Vector2 = pygame.math.Vector2()
         self._player_character: Player = player_character
+        # every sprite moves by the same camera offset, so it is tracked only once.
+        # Entities keep their own tracker for their own movement, so camera and
+        # self movement sub-pixel remainders no longer cancel each other out
+        self._camera_tracker: Tile = Tile(())
+
+    def add_ground(self, *sprites: pygame.sprite.Sprite) -> None:
+        """Add flat sprites drawn below all other sprites.
+
+        Ground sprites such as terrain tiles are moved with the camera like any
+        other sprite, but they are drawn first and in the order they were added
+        instead of being y-sorted with the upright sprites standing on them.
+        The ground culling margin is measured when sprites are added, so ground
+        sprites must not grow afterwards.
+
+        Parameters
+        ----------
+        sprites: pygame.sprite.Sprite
+            The sprites, or groups of sprites, to add to the ground layer
+        """
+        self._adding_ground = True
+        try:
+            self.add(*sprites)
+        finally:
+            self._adding_ground = False
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer: int = None) -> None:
+        """Add a sprite to the group and to the ground or y-sorted list.
+
+        Parameters
+        ----------
+        sprite: pygame.sprite.Sprite
+            The sprite being added
+        layer: int
+            Unused, kept for compatibility with pygame.sprite.AbstractGroup
+        """
+        super().add_internal(sprite, layer)
+        if self._adding_ground:
+            self._ground.append(sprite)
+            self._ground_sprites.add(sprite)
+            self._ground_margin = max(
+                self._ground_margin, *sprite.rect.size, *sprite.image.get_size()
+            )
+        else:
+            self._ysorted.append(sprite)
+            self._ysorted_dirty = True
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        """Remove a sprite from the group and from the ground or y-sorted list.
+
+        Parameters
+        ----------
+        sprite: pygame.sprite.Sprite
+            The sprite being removed
+        """
+        super().remove_internal(sprite)
+        if sprite in self._ground_sprites:
+            self._ground_sprites.remove(sprite)
+            self._ground.remove(sprite)
+        else:
+            self._ysorted.remove(sprite)
+
+    def sort_by_bottom(self) -> None:
+        """Restore the y-sorted order of the upright sprites.
+
+        Sprites only move a few pixels each frame, so the list is nearly sorted
+        and a single insertion sort pass is close to linear. A full sort is only
+        needed after new sprites have been appended.
+        """
+        sprites: list[pygame.sprite.Sprite] = self._ysorted
+        if self._ysorted_dirty:
+            sprites.sort(key=self.BOTTOM_KEY)
+            self._ysorted_dirty = False
+            return
+
+        # read every key once through attrgetter, then compare plain ints
+        bottoms: list[int] = list(map(self.BOTTOM_KEY, sprites))
+        for index in range(1, len(sprites)):
+            bottom: int = bottoms[index]
+            if bottoms[index - 1] <= bottom:
+                continue
+            sprite: pygame.sprite.Sprite = sprites[index]
+            position: int = index
+            while position > 0 and bottoms[position - 1] > bottom:
+                bottoms[position] = bottoms[position - 1]
+                sprites[position] = sprites[position - 1]
+                position -= 1
+            bottoms[position] = bottom
+            sprites[position] = sprite
 
     def camera_update(self) -> None:
         """Update the camera sprites.
 
-        This method will set the direction of camera sprites to be the
-        opposite direction of the player's heading.
+        This method will move the camera sprites in the opposite direction of
+        the player's heading. The movement is tracked once for the whole group
+        and the resulting pixel offset is applied to every sprite.
         Note that non-player entities will move at a slower speed than the player
         due to being moved in the opposite direction of the player at the
         player's speed.
         """
-        for sprite in sorted(self.sprites(), key=lambda sprite: sprite.rect.centery):
-            # offset = sprite.rect.topleft - self.offset
-            previous_direction: pygame.math.Vector2 = sprite.compass.copy()
-            sprite.compass = self._player_character.compass.copy() * -1
-            sprite.move(self._player_character.speed)
-            sprite.compass = pygame.math.Vector2(
-                previous_direction.x, previous_direction.y
-            )
+        self.sort_by_bottom()
+        # the camera heading is the same for every sprite, compute it once
+        player_compass: pygame.math.Vector2 = self._player_character.compass
+        camera_x: float = -player_compass.x
+        camera_y: float = -player_compass.y
+        speed: int = self._player_character.speed
+
+        camera_tracker: Tile = self._camera_tracker
+        camera_rect: pygame.Rect = camera_tracker.rect
+        previous_x: int = camera_rect.x
+        previous_y: int = camera_rect.y
+        camera_tracker.move_with(camera_x, camera_y, speed)
+        offset: tuple[int, int] = (
+            camera_rect.x - previous_x,
+            camera_rect.y - previous_y,
+        )
+        if offset == (0, 0):
+            return
+
+        # resolve the method once rather than through each sprite's attributes
+        move_and_update_hitbox: Callable = Tile.move_and_update_hitbox
+        for sprite in self.spritedict:
+            move_and_update_hitbox(sprite, offset)
+
+    def camera_draw(self) -> None:
+        """Draw the camera sprites onto the display surface.
+
+        The ground is drawn first, then the upright sprites in y-sorted order so
+        that lower sprites overlap the ones above them. Sprites outside of the view
+        are culled, the rest are sent to the surface in a single blits call and no
+        dirty rects are returned, since the whole screen is redrawn each frame.
+
+        Images are drawn at their rect's topleft and may be larger than the rect,
+        so the view is padded by the largest rect or image side before culling.
+        Upright sprites can change size at any time, so their margin is measured
+        every frame.
+        """
+        if self._ysorted_dirty:
+            self.sort_by_bottom()
+        ground: list[pygame.sprite.Sprite] = self._ground
+        sprites: list[pygame.sprite.Sprite] = self._ysorted
+        view_rect: pygame.Rect = self._view_rect
+        ground_margin: int = self._ground_margin
+        # rotated images can be larger than their rect, so both sizes count
+        margin: int = 0
+        for sprite in sprites:
+            rect: pygame.Rect = sprite.rect
+            image_width, image_height = sprite.image.get_size()
+            margin = max(margin, rect.width, rect.height, image_width, image_height)
+
+        # collidelistall keeps the index order, so the draw order is preserved
+        ground_cull_rect: pygame.Rect = view_rect.inflate(
+            ground_margin * 2, ground_margin * 2
+        )
+        blit_sequence: list[tuple[pygame.Surface, pygame.Rect]] = [
+            (ground[index].image, ground[index].rect)
+            for index in ground_cull_rect.collidelistall(ground)
+        ]
+
+        # the list is y-sorted, so the rows in view are a contiguous slice
+        cull_rect: pygame.Rect = view_rect.inflate(margin * 2, margin * 2)
+        first: int = bisect_left(sprites, cull_rect.top, key=self.BOTTOM_KEY)
+        last: int = bisect_right(
+            sprites, cull_rect.bottom + margin, first, key=self.BOTTOM_KEY
+        )
+        rows_in_view: list[pygame.sprite.Sprite] = sprites[first:last]
+        blit_sequence.extend(
+            (rows_in_view[index].image, rows_in_view[index].rect)
+            for index in cull_rect.collidelistall(rows_in_view)
+        )
+        self._display_surface.blits(blit_sequence, doreturn=False)
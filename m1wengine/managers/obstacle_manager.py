@@ -0,0 +1,154 @@
+"""This module contains the ObstacleManager class."""
+import pygame
+from m1wengine.settings import TILESIZE
+
+
+class ObstacleManager(pygame.sprite.Group):
+    """Obstacle Manager class.
+
+    This sprite group indexes its obstacles in a spatial hash of tile sized cells,
+    so collision checks only need to test the obstacles in the cells a rect
+    covers instead of every obstacle in the level.
+
+    Every obstacle must be in the CameraManager, which moves all of them by the
+    same offset. That offset is measured on an anchor obstacle and removed from
+    every query, so the hash stays valid without being rebuilt. Code that moves or
+    resizes an obstacle in any other way must call mark_dirty afterwards, or
+    collisions with that obstacle will be missed. The hash is also rebuilt
+    whenever obstacles are added or removed.
+
+    Attributes
+    ----------
+    _grid: dict[tuple[int, int], list[pygame.sprite.Sprite]]
+        The obstacles overlapping each cell, keyed by cell coordinates
+    _order: dict[pygame.sprite.Sprite, int]
+        The position of each obstacle in the group, used to keep query order
+    _anchor: pygame.sprite.Sprite
+        The obstacle used to measure how far the camera moved the obstacles
+    _anchor_origin: tuple[int, int]
+        The anchor position when the hash was built
+    _grid_dirty: bool
+        Flag whether the hash must be rebuilt before the next query
+
+    Methods
+    -------
+    add_internal(self, sprite: pygame.sprite.Sprite, layer: int = None)
+        Add an obstacle and flag the hash for a rebuild
+    remove_internal(self, sprite: pygame.sprite.Sprite)
+        Remove an obstacle and flag the hash for a rebuild
+    mark_dirty(self)
+        Flag the hash for a rebuild after an obstacle moved on its own
+    rebuild(self)
+        Index every obstacle in the cells its rect covers
+    sprites_near(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]
+        Get the obstacles sharing a cell with the rect
+    """
+
+    CELL_SIZE: int = TILESIZE
+
+    def __init__(self, *sprites: pygame.sprite.Sprite) -> None:
+        """Construct an ObstacleManager object.
+
+        Parameters
+        ----------
+        sprites: pygame.sprite.Sprite
+            The obstacles to start the group with
+        """
+        self._grid: dict[tuple[int, int], list[pygame.sprite.Sprite]] = {}
+        self._order: dict[pygame.sprite.Sprite, int] = {}
+        self._anchor: pygame.sprite.Sprite = None
+        self._anchor_origin: tuple[int, int] = (0, 0)
+        self._grid_dirty: bool = True
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: pygame.sprite.Sprite, layer: int = None) -> None:
+        """Add an obstacle and flag the hash for a rebuild.
+
+        Parameters
+        ----------
+        sprite: pygame.sprite.Sprite
+            The obstacle being added
+        layer: int
+            Unused, kept for compatibility with pygame.sprite.AbstractGroup
+        """
+        super().add_internal(sprite, layer)
+        self._grid_dirty = True
+
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        """Remove an obstacle and flag the hash for a rebuild.
+
+        Parameters
+        ----------
+        sprite: pygame.sprite.Sprite
+            The obstacle being removed
+        """
+        super().remove_internal(sprite)
+        self._grid_dirty = True
+
+    def mark_dirty(self) -> None:
+        """Flag the hash for a rebuild after an obstacle moved on its own.
+
+        Moves made by the CameraManager are already accounted for, any other
+        change to an obstacle rect must be followed by a call to this method.
+        """
+        self._grid_dirty = True
+
+    def rebuild(self) -> None:
+        """Index every obstacle in the cells its rect covers."""
+        cell_size: int = self.CELL_SIZE
+        self._grid = {}
+        self._order = {}
+        self._anchor = None
+        for index, sprite in enumerate(self.sprites()):
+            self._order[sprite] = index
+            rect: pygame.Rect = sprite.rect
+            for cell_x in range(rect.left // cell_size, rect.right // cell_size + 1):
+                for cell_y in range(
+                    rect.top // cell_size, rect.bottom // cell_size + 1
+                ):
+                    self._grid.setdefault((cell_x, cell_y), []).append(sprite)
+            if self._anchor is None:
+                self._anchor = sprite
+                self._anchor_origin = rect.topleft
+        self._grid_dirty = False
+
+    def sprites_near(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+        """Get the obstacles sharing a cell with the rect.
+
+        Any obstacle colliding with the rect is part of the result, in the same
+        order as the group, but the result may also hold obstacles that only
+        share a cell with the rect. The hash is rebuilt first if it is dirty.
+
+        Parameters
+        ----------
+        rect: pygame.Rect
+            The rect to find nearby obstacles for
+
+        Returns
+        -------
+        nearby_sprites: list[pygame.sprite.Sprite]
+            The obstacles in the cells covered by the rect
+        """
+        if self._grid_dirty:
+            self.rebuild()
+        if self._anchor is None:
+            return []
+
+        cell_size: int = self.CELL_SIZE
+        # move the rect back to where the obstacles were when the hash was built
+        offset_x: int = self._anchor.rect.x - self._anchor_origin[0]
+        offset_y: int = self._anchor.rect.y - self._anchor_origin[1]
+        left: int = (rect.left - offset_x) // cell_size
+        right: int = (rect.right - offset_x) // cell_size
+        top: int = (rect.top - offset_y) // cell_size
+        bottom: int = (rect.bottom - offset_y) // cell_size
+
+        grid: dict[tuple[int, int], list[pygame.sprite.Sprite]] = self._grid
+        nearby_sprites: set[pygame.sprite.Sprite] = set()
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                cell: list[pygame.sprite.Sprite] = grid.get((cell_x, cell_y))
+                if cell:
+                    nearby_sprites.update(cell)
+
+        return sorted(nearby_sprites, key=self._order.__getitem__)
@@ -424,8 +424,8 @@ class NPC(Character):
     def flee_movement(self) -> None:
         """Change direction based on where target is."""
         if self.facing_towards_entity(self._target_sprite):
-            # must set to copy or it gives the entity a shared compass
-            self.compass = self._target_sprite.compass.copy()
+            # copy into our own compass, sharing it would move both entities
+            self._compass.update(self._target_sprite.compass)
             self.collision_handler()
 
         # move according to the compass direction
@@ -470,7 +470,7 @@ class NPC(Character):
             self.speed = self.DEFAULT_SPEED_ZERO
         # rotate compass to target sprite
         self.rotate_compass_to_target_sprite()
-        self._initial_charge_compass = self.compass.copy()
+        self._initial_charge_compass.update(self._compass)
 
         # check if any good_sprites are on the tracker's radar
         collision_dictionary: dict = self.collision_detection(
@@ -495,7 +495,7 @@ class NPC(Character):
     def charge_movement(self) -> None:
         """Charge from current position until charge is disrupted."""
         # protect compass to prevent it from being overwritten
-        self.compass = self._initial_charge_compass.copy()
+        self._compass.update(self._initial_charge_compass)
 
         # if first loop, set _initial_charge_time
         if self._initial_charge_time == self.DEFAULT_TIMER_VALUE:
@@ -593,7 +593,7 @@ class NPC(Character):
         elif self.rect.y > self._target_sprite.rect.y:
             self.move_up(self.speed)
 
-        self.compass = self._target_sprite.compass.copy()
+        self._compass.update(self._target_sprite.compass)
 
     def set_state_default(self) -> None:
         """Set state to intermediary state, reset variables."""
@@ -628,7 +628,7 @@ class NPC(Character):
             self._current_state = self._states.Thrown
             # TODO: switch to tiles traveled
             self._last_time_stored = time.perf_counter()
-            self.compass = self._player.compass.copy()
+            self._compass.update(self._player.compass)
 
     def set_state_throw_windup(self) -> None:
         """Begin the windup action before throwing an NPC."""
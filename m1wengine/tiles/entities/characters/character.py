@@ -3,12 +3,16 @@ import math
 import pygame
 from m1wengine.enums.direction import Direction
 from m1wengine.dict_structures.animation_dict import AnimationDict
+from m1wengine.managers.obstacle_manager import ObstacleManager
 from m1wengine.tiles.entities.entity import Entity
 from m1wengine.score_controller import ScoreController
 from m1wengine.tiles.tile import Tile
 
 # number of images for each directional animation
 WALKING_IMAGE_COUNT: int = 3
+# normals used to bounce a compass off horizontal and vertical walls
+HORIZONTAL_REFLECT_VECTOR: pygame.math.Vector2 = pygame.math.Vector2(Direction.right, 0)
+VERTICAL_REFLECT_VECTOR: pygame.math.Vector2 = pygame.math.Vector2(0, Direction.down)
 
 
 class Character(Entity):
@@ -173,26 +177,30 @@ class Character(Entity):
         This function inspects the current compass direction and determines
         what the status should be.
         """
+        # read the compass once, each Vector2 attribute access is a lookup
+        compass_x: float = self._compass.x
+        compass_y: float = self._compass.y
+
         # handle all edge cases first
-        if self.compass.y < 0:
+        if compass_y < 0:
             self._status = "up"
         else:
             self._status = "down"
 
-        if self.compass.x < 0:
+        if compass_x < 0:
             self._status = "left"
         else:
             self._status = "right"
 
         # -- xy | xy +-
         # -+ xy | xy ++
-        if self.compass.x > 0 and self.compass.y < 0.25 and self.compass.y > -0.25:
+        if compass_x > 0 and compass_y < 0.25 and compass_y > -0.25:
             self._status = "right"
-        if self.compass.x < 0 and self.compass.y < 0.25 and self.compass.y > -0.25:
+        if compass_x < 0 and compass_y < 0.25 and compass_y > -0.25:
             self._status = "left"
-        if self.compass.y > 0 and self.compass.x < 0.25 and self.compass.x > -0.25:
+        if compass_y > 0 and compass_x < 0.25 and compass_x > -0.25:
             self._status = "down"
-        if self.compass.y < 0 and self.compass.x < 0.25 and self.compass.x > -0.25:
+        if compass_y < 0 and compass_x < 0.25 and compass_x > -0.25:
             self._status = "up"
 
     def get_angle_from_direction(self, axis: str) -> float:
@@ -290,12 +298,12 @@ class Character(Entity):
         sorted_collisions: dict[str, any]
             All the collision information between this sprite and a group.
         """
-        # get list of sprites from the passed in sprite group
-        obstacle_sprites: list = sprite_group.sprites()
-        # extract list of rects from obstacle_sprites
-        sprite_rects: list[pygame.Rect] = list()
-        for sprite in obstacle_sprites:
-            sprite_rects.append(sprite.rect)
+        # get list of sprites from the passed in sprite group, an ObstacleManager
+        # only returns the sprites close enough to collide
+        if isinstance(sprite_group, ObstacleManager):
+            obstacle_sprites: list = sprite_group.sprites_near(rect_to_test)
+        else:
+            obstacle_sprites: list = sprite_group.sprites()
 
         # list of all obstacle sprite indicies player has collisions with
         collision_indicies: list[int] = rect_to_test.collidelistall(obstacle_sprites)
@@ -366,7 +374,7 @@ class Character(Entity):
                     x_dist_out_hitbox = 1
 
             if x_dist_out_hitbox != 0:
-                self.rect.move_ip(x_dist_out_hitbox, 0)
+                self.move_and_update_hitbox((x_dist_out_hitbox, 0))
         else:
             y_dist_out_hitbox: int = 0
             # collided sprite is below
@@ -381,7 +389,7 @@ class Character(Entity):
                     y_dist_out_hitbox = 1
 
             if y_dist_out_hitbox != 0:
-                self.rect.move_ip(0, y_dist_out_hitbox)
+                self.move_and_update_hitbox((0, y_dist_out_hitbox))
 
     def further_axis(self, coord: tuple) -> str:
         """Find the further axis.
@@ -461,14 +469,6 @@ class Character(Entity):
         collided_coords: tuple
             A tuple containing the x and y of the average collision point
         """
-        # used to flip x and y by the given amounts in the below vectors
-        horizontal_reflect_vect: pygame.math.Vector2 = pygame.math.Vector2(
-            Direction.right, 0
-        )
-        vertical_reflect_vect: pygame.math.Vector2 = pygame.math.Vector2(
-            0, Direction.down
-        )
-
         abs_distance_to_x: int = abs(self.rect.centerx - collided_coords[0])
         abs_distance_to_y: int = abs(self.rect.centery - collided_coords[1])
         distance_to_x: int = collided_coords[0] - self.rect.centerx
@@ -481,13 +481,13 @@ class Character(Entity):
                 # if compass pointing right
                 if self.compass.x > 0:
                     # bounce the compass off a horizontal vector
-                    self.compass = self.compass.reflect(horizontal_reflect_vect)
+                    self._compass.reflect_ip(HORIZONTAL_REFLECT_VECTOR)
             # if collided with sprite to the left of self
             else:
                 # if compass pointing left
                 if self.compass.x < 0:
                     # bounce the compass off a horizontal vector
-                    self.compass = self.compass.reflect(horizontal_reflect_vect)
+                    self._compass.reflect_ip(HORIZONTAL_REFLECT_VECTOR)
 
         # if up or down
         else:
@@ -496,10 +496,10 @@ class Character(Entity):
                 # if compass pointing up
                 if self.compass.y < 0:
                     # bounce the compass off a vertical vector
-                    self.compass = self.compass.reflect(vertical_reflect_vect)
+                    self._compass.reflect_ip(VERTICAL_REFLECT_VECTOR)
             # if collided with sprite below self
             else:
                 # if compass pointing down
                 if self.compass.y > 0:
                     # bounce the compass off a vertical vector
-                    self.compass = self.compass.reflect(vertical_reflect_vect)
+                    self._compass.reflect_ip(VERTICAL_REFLECT_VECTOR)
@@ -3,6 +3,12 @@ import pygame
 from m1wengine.file_managers.sprite_sheet import SpriteSheet
 from m1wengine.tiles.tile import Tile
 
+# sprite sheets and their sliced animations, shared by every entity using the same
+# sheet path and animation layout. The animation surfaces are never modified after
+# they are loaded.
+_SPRITE_SHEET_CACHE: dict[str, SpriteSheet] = {}
+_ASSET_CACHE: dict[tuple, dict[str, list[pygame.Surface]]] = {}
+
 
 class Entity(Tile):
     """Entity class.
@@ -21,6 +27,8 @@ class Entity(Tile):
         The dictionary containing all animations for the current direction
     _sprite_sheet: SpriteSheet
         Handler for entire sprite sheet of animation images
+    _sprite_sheet_path: str
+        The filepath of the sprite sheet, part of the asset cache key
     _status: str
         The direction a character is facing stored as a string
 
@@ -57,9 +65,12 @@ class Entity(Tile):
         self._animation_speed: float = 0.15
         self._animations: dict = {}
 
-        self._sprite_sheet: SpriteSheet = SpriteSheet(
-            sprite_sheet_path, pygame.Color("black")
-        )
+        self._sprite_sheet_path: str = sprite_sheet_path
+        if sprite_sheet_path not in _SPRITE_SHEET_CACHE:
+            _SPRITE_SHEET_CACHE[sprite_sheet_path] = SpriteSheet(
+                sprite_sheet_path, pygame.Color("black")
+            )
+        self._sprite_sheet: SpriteSheet = _SPRITE_SHEET_CACHE[sprite_sheet_path]
         self._status: str = "right"
         self.image = self._sprite_sheet.image_at(image_rect)
         self.import_assets()
@@ -91,8 +102,27 @@ class Entity(Tile):
         """Import and divide the animation image into it's smaller parts.
 
         Import all Entity animations according to the animation dictionary passed in.
+        Animations are sliced once per sprite sheet and animation layout, and
+        shared by all entities using that sheet with the same layout.
         """
-        for animation in self._animation_dict:
-            self._animations[animation["name"]] = self._sprite_sheet.load_strip(
-                animation["image_rect"], animation["image_count"]
-            )
+        # entities of different types or sizes may slice the same sheet differently
+        cache_key: tuple = (
+            self._sprite_sheet_path,
+            tuple(
+                (
+                    animation["name"],
+                    tuple(animation["image_rect"]),
+                    animation["image_count"],
+                )
+                for animation in self._animation_dict
+            ),
+        )
+        animations: dict[str, list[pygame.Surface]] = _ASSET_CACHE.get(cache_key)
+        if animations is None:
+            animations = {}
+            for animation in self._animation_dict:
+                animations[animation["name"]] = self._sprite_sheet.load_strip(
+                    animation["image_rect"], animation["image_count"]
+                )
+            _ASSET_CACHE[cache_key] = animations
+        self._animations = animations
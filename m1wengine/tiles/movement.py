@@ -0,0 +1,59 @@
+"""This module contains the movement tracker math used by tiles."""
+from m1wengine.enums.direction import Direction
+
+# plain ints bound once, so the per-frame math skips the enum attribute lookups
+UP: int = int(Direction.up)
+DOWN: int = int(Direction.down)
+LEFT: int = int(Direction.left)
+RIGHT: int = int(Direction.right)
+STOP: int = int(Direction.stop)
+
+
+def apply_movement(
+    compass_x: float,
+    compass_y: float,
+    horizontal_tracker: float,
+    vertical_tracker: float,
+) -> tuple[int, int, float, float]:
+    """Advance the movement trackers along a heading.
+
+    Each time a tracker reaches 1 or -1 a step is taken on that axis and the
+    tracker is moved back towards 0 by that step.
+
+    Parameters
+    ----------
+    compass_x: float
+        The x direction of movement bounded [-1, 1]
+    compass_y: float
+        The y direction of movement bounded [-1, 1]
+    horizontal_tracker: float
+        How far the tile has traveled horizontally without moving
+    vertical_tracker: float
+        How far the tile has traveled vertically without moving
+
+    Returns
+    -------
+    step_x: int
+        The horizontal step to take: LEFT, STOP or RIGHT
+    step_y: int
+        The vertical step to take: UP, STOP or DOWN
+    horizontal_tracker: float
+        The updated horizontal tracker
+    vertical_tracker: float
+        The updated vertical tracker
+    """
+    horizontal_tracker += compass_x
+    vertical_tracker += compass_y
+
+    # the step is the sign of the tracker once it reaches 1 or -1, and taking
+    # the step moves the tracker back towards 0 by the same amount
+    step_x: int = (
+        RIGHT
+        if horizontal_tracker >= RIGHT
+        else (LEFT if horizontal_tracker <= LEFT else STOP)
+    )
+    step_y: int = (
+        DOWN if vertical_tracker >= DOWN else (UP if vertical_tracker <= UP else STOP)
+    )
+
+    return step_x, step_y, horizontal_tracker - step_x, vertical_tracker - step_y
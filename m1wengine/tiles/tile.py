@@ -1,6 +1,7 @@
 """This module contains the Tile class."""
 import pygame
 from m1wengine.enums.direction import Direction
+from m1wengine.tiles.movement import apply_movement
 
 
 class Tile(pygame.sprite.Sprite):
@@ -8,8 +9,10 @@ class Tile(pygame.sprite.Sprite):
 
     Attributes
     ----------
-    _movement_tracker: dict[str, float]
-        Contains how far the entity has traveled without moving
+    _horizontal_tracker: float
+        How far the entity has traveled horizontally without moving
+    _vertical_tracker: float
+        How far the entity has traveled vertically without moving
     _compass: pygame.math.Vector2
         The x and y direction of movement bounded [-1, 1]
     _image: pygame.Surface
@@ -31,6 +34,8 @@ class Tile(pygame.sprite.Sprite):
         Change the tile image
     move(self, speed: int)
         Handles movement of the entity
+    move_with(self, compass_x: float, compass_y: float, speed: int)
+        Handles movement of the entity along the given heading
     move_left(self, speed: int)
         Moves left
     move_right(self, speed: int)
@@ -43,16 +48,19 @@ class Tile(pygame.sprite.Sprite):
         Tracks where to move
     set_tile(self, x: int, y: int, surface: pygame.surface)
         sets all info for a background tile
-    _move_left(self, speed: int)
-        Internal move left
-    _move_right(self, speed: int)
-        Internal move right
-    _move_up(self, speed: int)
-        Internal move up
-    _move_down(self, speed: int)
-        Internal move down
     """
 
+    # per-frame attributes are slots to skip the instance dict on lookups
+    __slots__ = (
+        "_horizontal_tracker",
+        "_vertical_tracker",
+        "_compass",
+        "_image",
+        "_rect",
+        "_hitbox",
+        "_move_remainder",
+    )
+
     # default speed used for all movement
     DEFAULT_SPEED: int = 10
 
@@ -65,7 +73,8 @@ class Tile(pygame.sprite.Sprite):
             The groups this sprite is a part of
         """
         super().__init__(groups)
-        self._movement_tracker: dict[str, float] = {"vertical": 0.0, "horizontal": 0.0}
+        self._horizontal_tracker: float = 0.0
+        self._vertical_tracker: float = 0.0
         self._compass: pygame.math.Vector2 = pygame.math.Vector2(0, 0)
 
         self._image: pygame.Surface = object()
@@ -153,27 +162,36 @@ class Tile(pygame.sprite.Sprite):
         speed: int
             Multiplier for changing the sprite position
         """
+        self.move_with(self._compass.x, self._compass.y, speed)
+
+    def move_with(
+        self, compass_x: float, compass_y: float, speed: int = DEFAULT_SPEED
+    ) -> None:
+        """Handle movement of the tile along a given heading.
+
+        Same as move, but the heading is passed in instead of being read from the
+        compass, so callers can move the tile without swapping its compass.
+
+        Parameters
+        ----------
+        compass_x: float
+            The x direction of movement bounded [-1, 1]
+        compass_y: float
+            The y direction of movement bounded [-1, 1]
+        speed: int
+            Multiplier for changing the sprite position
+        """
         # move each time a tracker is 1 or -1 and then reset the tracker
-        self.update_movement_tracker()
-
-        up: Direction = Direction.up
-        down: Direction = Direction.down
-        left: Direction = Direction.left
-        right: Direction = Direction.right
-
-        if self._movement_tracker["vertical"] <= up:
-            self._move_up(speed)
-            self._movement_tracker["vertical"] += down
-        elif self._movement_tracker["vertical"] >= down:
-            self._move_down(speed)
-            self._movement_tracker["vertical"] += up
-
-        if self._movement_tracker["horizontal"] <= left:
-            self._move_left(speed)
-            self._movement_tracker["horizontal"] += right
-        elif self._movement_tracker["horizontal"] >= right:
-            self._move_right(speed)
-            self._movement_tracker["horizontal"] += left
+        movement: tuple[int, int, float, float] = apply_movement(
+            compass_x, compass_y, self._horizontal_tracker, self._vertical_tracker
+        )
+        step_x, step_y, self._horizontal_tracker, self._vertical_tracker = movement
+
+        # the step is the direction of the move, refine the speed once per axis
+        move_pixels_y: int = step_y * self.refine_speed(speed) if step_y else 0
+        move_pixels_x: int = step_x * self.refine_speed(speed) if step_x else 0
+        if move_pixels_x or move_pixels_y:
+            self.move_and_update_hitbox((move_pixels_x, move_pixels_y))
 
     def move_right(self, speed: int = DEFAULT_SPEED) -> None:
         """Move to the right.
@@ -187,7 +205,7 @@ class Tile(pygame.sprite.Sprite):
         """
         self._compass.x = Direction.right
         self._compass.y = 0
-        self._move_right(speed)
+        self.move_and_update_hitbox((self.refine_speed(speed), 0))
 
     def move_left(self, speed: int = DEFAULT_SPEED) -> None:
         """Move to the left.
@@ -201,7 +219,7 @@ class Tile(pygame.sprite.Sprite):
         """
         self._compass.x = Direction.right
         self._compass.y = 0
-        self._move_left(speed)
+        self.move_and_update_hitbox((-self.refine_speed(speed), 0))
 
     def move_up(self, speed: int = DEFAULT_SPEED) -> None:
         """Move up.
@@ -215,7 +233,7 @@ class Tile(pygame.sprite.Sprite):
         """
         self._compass.x = 0
         self._compass.y = Direction.up
-        self._move_up(speed)
+        self.move_and_update_hitbox((0, -self.refine_speed(speed)))
 
     def move_down(self, speed: int = DEFAULT_SPEED) -> None:
         """Move down.
@@ -229,7 +247,7 @@ class Tile(pygame.sprite.Sprite):
         """
         self._compass.x = 0
         self._compass.y = Direction.down
-        self._move_down(speed)
+        self.move_and_update_hitbox((0, self.refine_speed(speed)))
 
     def update_movement_tracker(self) -> None:
         """Update movement tracker.
@@ -239,8 +257,8 @@ class Tile(pygame.sprite.Sprite):
         and the tracker will be modified by that move distance in pixels towards 0.
         Speed can multiply the number of pixels moved at a time.
         """
-        self._movement_tracker["horizontal"] += self._compass.x
-        self._movement_tracker["vertical"] += self._compass.y
+        self._horizontal_tracker += self._compass.x
+        self._vertical_tracker += self._compass.y
 
     def set_tile(self, coords: tuple, surface: pygame.Surface) -> None:
         """Set the position and surface of a tile.
@@ -260,62 +278,6 @@ class Tile(pygame.sprite.Sprite):
         """Remove the sprite from all groups."""
         self.kill()
 
-    def _move_left(self, speed: int) -> None:
-        """Move to the left.
-
-        Parameters
-        ----------
-        speed: int
-            Multiplier for changing the sprite position
-        """
-        speed = self.refine_speed(speed)
-        move_pixels_x: int = -1 * speed
-        move_pixels_y: int = 0
-        move_tuple: pygame.Vector2 = pygame.Vector2(move_pixels_x, move_pixels_y)
-        self.move_and_update_hitbox(move_tuple)
-
-    def _move_right(self, speed: int) -> None:
-        """Move to the right.
-
-        Parameters
-        ----------
-        speed: int
-            Multiplier for changing the sprite position
-        """
-        speed = self.refine_speed(speed)
-        move_pixels_x: int = speed
-        move_pixels_y: int = 0
-        move_tuple: pygame.Vector2 = pygame.Vector2(move_pixels_x, move_pixels_y)
-        self.move_and_update_hitbox(move_tuple)
-
-    def _move_up(self, speed: int) -> None:
-        """Move up.
-
-        Parameters
-        ----------
-        speed: int
-            Multiplier for changing the sprite position
-        """
-        speed = self.refine_speed(speed)
-        move_pixels_x: int = 0
-        move_pixels_y: int = -1 * speed
-        move_tuple: pygame.Vector2 = pygame.Vector2(move_pixels_x, move_pixels_y)
-        self.move_and_update_hitbox(move_tuple)
-
-    def _move_down(self, speed: int) -> None:
-        """Move down.
-
-        Parameters
-        ----------
-        speed: int
-            Multiplier for changing the sprite position
-        """
-        speed = self.refine_speed(speed)
-        move_pixels_x: int = 0
-        move_pixels_y: int = speed
-        move_tuple: pygame.Vector2 = pygame.Vector2(move_pixels_x, move_pixels_y)
-        self.move_and_update_hitbox(move_tuple)
-
     def refine_speed(self, speed: int) -> int:
         """Reduce speed by factor of 10 and save remainder.
 
@@ -339,13 +301,15 @@ class Tile(pygame.sprite.Sprite):
         speed = int(speed + self._move_remainder)
         return speed
 
-    def move_and_update_hitbox(self, move_coordinates: pygame.Vector2) -> None:
+    def move_and_update_hitbox(self, move_coordinates: tuple[int, int]) -> None:
         """Move tile by x, y pixels and update hitbox.
 
         Parameters
         ----------
-        move_coordinates: pygame.Vector2
+        move_coordinates: tuple[int, int]
             The number of x and y pixels to move.
         """
         self.rect.move_ip(move_coordinates)
-        self._hitbox.center = self.rect.center
+        # background tiles use their rect as the hitbox, don't move it twice
+        if self._hitbox is not self.rect:
+            self._hitbox.move_ip(move_coordinates)
@@ -1,6 +1,7 @@
 """This module contains the Level class."""
 import pygame
 from m1wengine.managers.camera_manager import CameraManager
+from m1wengine.managers.obstacle_manager import ObstacleManager
 from m1wengine.tiles.tile import Tile
 from m1wengine.file_managers.support import import_csv_layout
 from m1wengine.settings import TILESIZE
@@ -13,6 +14,8 @@ from items.crystal import Crystal
 from neutral_NPCs.postman import Postman
 from game_data import level_data, character_keys, item_keys
 
+TILE_COLOR_KEY: pygame.Color = pygame.Color("black")
+
 
 class Level(object):
     """Level class.
@@ -33,7 +36,7 @@ class Level(object):
         The sprite group containing all the fence sprites
     _extra_sprites: pygame.sprite.Group
         The sprite group containing all the extra sprites
-    _obstacle_sprites: pygame.sprite.Group
+    _obstacle_sprites: ObstacleManager
         The sprites group containing all sprites that Characters cannot move through
     _bad_sprites: pygame.sprite.Group
         The sprite group for all bad aligned sprites
@@ -152,7 +155,7 @@ class Level(object):
 
     def create_sprite_groups(self) -> None:
         """Create all sprite groups for the level."""
-        self._obstacle_sprites = pygame.sprite.Group()
+        self._obstacle_sprites = ObstacleManager()
         self._bad_sprites = pygame.sprite.Group()
         self._good_sprites = pygame.sprite.Group()
         self._neutral_sprites = pygame.sprite.Group()
@@ -249,7 +252,7 @@ class Level(object):
                     tile_surface: pygame.Surface = universal_assets[int(val)]
                     sprite: Tile = Tile(sprite_group)
                     sprite.set_tile(coords, tile_surface)
-                    sprite.image.set_colorkey(pygame.Color("black"), pygame.RLEACCEL)
+                    sprite.image.set_colorkey(TILE_COLOR_KEY, pygame.RLEACCEL)
                     sprite_group.add(sprite)
 
         return sprite_group
@@ -260,7 +263,8 @@ class Level(object):
 
     def add_sprites_to_camera(self) -> None:
         """Add all visible sprites to the CameraManager."""
-        self._camera.add(self._terrain_sprites)
+        # flat terrain is drawn below everything standing on it
+        self._camera.add_ground(self._terrain_sprites)
         self._camera.add(self._plant_sprites)
         self._camera.add(self._fence_sprites)
         self._camera.add(self._extra_sprites)
@@ -290,7 +294,7 @@ class Level(object):
             # draw the game behind the player character
             self._camera.camera_update()
 
-        self._camera.draw(self._display_surface)
+        self._camera.camera_draw()
         # draw the player chacter
         self._player_group.draw(self._display_surface)
         self._hud.draw(self._display_surface)